@@ -7,6 +7,19 @@ namespace MultiRoomAudio.Controllers;
 /// </summary>
 public static class ProvidersEndpoint
 {
+    // Sendspin-only implementation. The list is static, so build it once
+    // rather than allocating it on every request.
+    private static readonly IReadOnlyList<ProviderInfo> Providers = new[]
+    {
+        new ProviderInfo
+        {
+            Type = "sendspin",
+            DisplayName = "Sendspin",
+            Available = true,
+            Description = "Native SendSpin.SDK audio streaming"
+        }
+    };
+
     /// <summary>
     /// Registers provider information API endpoints with the application.
     /// </summary>
@@ -25,22 +38,7 @@ public static class ProvidersEndpoint
 
         // GET /api/providers - List available providers
         // NOTE: Not called by UI - reserved for future multi-provider support
-        group.MapGet("/", () =>
-        {
-            // Sendspin-only implementation
-            var providers = new[]
-            {
-                new ProviderInfo
-                {
-                    Type = "sendspin",
-                    DisplayName = "Sendspin",
-                    Available = true,
-                    Description = "Native SendSpin.SDK audio streaming"
-                }
-            };
-
-            return Results.Ok(providers);
-        })
+        group.MapGet("/", () => Results.Ok(Providers))
         .WithName("ListProviders")
         .WithDescription("Get available audio player providers");
     }